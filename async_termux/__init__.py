@@ -4,3 +4,10 @@ from .sensor import *
 from .media import *
 from .misc import *
 from .version import VERSION
+
+def __getattr__(name):
+    # tool paths are resolved lazily by _task, keep them reachable from the package
+    from . import _task
+    if name in _task._TOOL_NAMES:
+        return getattr(_task, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
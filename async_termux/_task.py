@@ -1,6 +1,6 @@
 import os
 import asyncio
-import shlex
+import json
 
 def _is_in_termux():
     return os.environ.get("TMPDIR", "/root").startswith("/data/data/com.termux")
@@ -10,13 +10,10 @@ def _find_in_path(file, path=None):
         path = os.environ['PATH']
     paths = path.split(os.pathsep)
     for p in paths:
-        try:
-            for f in os.listdir(p):
-                if f != file: continue
-                f_path = os.path.join(p, file)
-                if os.path.isfile(f_path):
-                    return f_path
-        except FileNotFoundError: pass
+        if not p: continue # empty entry would probe the current directory
+        f_path = os.path.join(p, file)
+        if os.path.isfile(f_path):
+            return os.path.abspath(f_path)
     return None
 TERMUX_ROOTDIR = "/data/data/com.termux/files"
 TERMUX_HOMEDIR = os.path.join(TERMUX_ROOTDIR, "home")
@@ -26,41 +23,104 @@ DEFAULT_PATH = os.path.join(TERMUX_ROOTDIR, "usr", "bin")
 SYSTEM_PATH = "/system/bin"
 TMPDIR = os.environ.get("TMPDIR", DEFAULT_TMPDIR) if _is_in_termux() else DEFAULT_TMPDIR
 PATH = os.environ.get("PATH", DEFAULT_PATH) if _is_in_termux() else DEFAULT_PATH
-TERMUX_TOAST = _find_in_path("termux-toast", PATH)
-TERMUX_NOTIFICATION = _find_in_path("termux-notification", PATH)
-TERMUX_NOTIFICATION_REMOVE = _find_in_path("termux-notification-remove", PATH)
-TERMUX_CLIPBOARD_GET = _find_in_path("termux-clipboard-get", PATH)
-TERMUX_CLIPBOARD_SET = _find_in_path("termux-clipboard-set", PATH)
-TERMUX_BATTERY_STATUS = _find_in_path("termux-battery-status", PATH)
-TERMUX_FINGERPRINT = _find_in_path("termux-fingerprint", PATH)
-TERMUX_VIBRATE = _find_in_path("termux-vibrate", PATH)
-TERMUX_MEDIA_PLAYER = _find_in_path("termux-media-player", PATH)
-TERMUX_SENSOR = _find_in_path("termux-sensor", PATH)
-ADB = _find_in_path("adb", PATH)
-CURL = _find_in_path("curl", PATH)
-SUDO = _find_in_path("sudo", PATH)
+BIN_CACHE_FILE = os.path.join(TMPDIR, "termux_bin_cache.json")
+
+def _path_key(path):
+    """ (dir, mtime) of every PATH dir, any install/uninstall changes it """
+    key = []
+    for p in path.split(os.pathsep):
+        try:
+            key.append([p, os.stat(p).st_mtime_ns])
+        except OSError: pass
+    return key
+
+def _load_bin_cache(key):
+    try:
+        with open(BIN_CACHE_FILE, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["key"] == key:
+            # only absolute paths are trusted, the file may be edited by others
+            return {k: v for k, v in data["bins"].items() if v is None or os.path.isabs(v)}
+    except Exception: pass
+    return {}
+
+def _save_bin_cache(key, bins):
+    tmp_file = f"{BIN_CACHE_FILE}.{os.getpid()}"
+    try:
+        with open(tmp_file, "wt", encoding="utf-8") as f:
+            json.dump({"key": key, "bins": bins}, f)
+        os.replace(tmp_file, BIN_CACHE_FILE)
+    except OSError: pass
+
+__bins = None
+
+def _find_bin(file):
+    global __bins
+    if __bins is None:
+        # resolve every known tool in one batch, so the cache is written at most once
+        key = _path_key(PATH)
+        __bins = _load_bin_cache(key)
+        missing = [f for f in _TOOL_NAMES.values() if f not in __bins]
+        if missing:
+            for f in missing:
+                __bins[f] = _find_in_path(f, PATH)
+            _save_bin_cache(key, __bins)
+    if file not in __bins:
+        __bins[file] = _find_in_path(file, PATH)
+    return __bins[file]
+
+# resolved on first access through the module __getattr__ below
+_TOOL_NAMES = {
+    "TERMUX_TOAST": "termux-toast",
+    "TERMUX_NOTIFICATION": "termux-notification",
+    "TERMUX_NOTIFICATION_REMOVE": "termux-notification-remove",
+    "TERMUX_CLIPBOARD_GET": "termux-clipboard-get",
+    "TERMUX_CLIPBOARD_SET": "termux-clipboard-set",
+    "TERMUX_BATTERY_STATUS": "termux-battery-status",
+    "TERMUX_FINGERPRINT": "termux-fingerprint",
+    "TERMUX_VIBRATE": "termux-vibrate",
+    "TERMUX_MEDIA_PLAYER": "termux-media-player",
+    "TERMUX_SENSOR": "termux-sensor",
+    "ADB": "adb",
+    "CURL": "curl",
+    "SUDO": "sudo",
+}
+
+def __getattr__(name):
+    file = _TOOL_NAMES.get(name)
+    if file is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _find_bin(file)
+    globals()[name] = value
+    return value
+
 AD_START = os.path.join(SYSTEM_PATH, "start")
 AD_STOP = os.path.join(SYSTEM_PATH, "stop")
 
 __background_tasks = set()
 
-def _create_bg_task(coro):
-    task = asyncio.create_task(coro)
+def _create_bg_task(coro, loop=None):
+    task = (loop or asyncio.get_running_loop()).create_task(coro)
     __background_tasks.add(task)
     task.add_done_callback(__background_tasks.discard)
 
 async def _run(cmd):
-    if not isinstance(cmd, str):
-        cmd = shlex.join(cmd)
-    proc = await asyncio.create_subprocess_shell(
-        cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE)
+    if isinstance(cmd, str):
+        proc = await asyncio.create_subprocess_shell(
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE)
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE)
     stdout, stderr = await proc.communicate()
     return proc, stdout, stderr
 
 async def _shell(cmd, *, stdin = True, stdout = True, stderr = True):
     if not isinstance(cmd, str):
+        import shlex
         cmd = shlex.join(cmd)
     proc = await asyncio.create_subprocess_shell(
         cmd,
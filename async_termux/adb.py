@@ -1,5 +1,6 @@
 from ._task import _run, _shell
-from ._task import ADB, SUDO, AD_START, AD_STOP
+from ._task import AD_START, AD_STOP
+from . import _task
 from .notify import NotificationManager, Notification
 from typing import Optional
 import asyncio
@@ -53,7 +54,7 @@ async def input_number_in_notification(nm: NotificationManager ,title="Input a n
 async def adb_pair_local(nm: NotificationManager):
     code = await input_number_in_notification(nm, "Pairing Code")
     port = await input_number_in_notification(nm, "Pairing Port")
-    args = [ADB, "pair", f"127.0.0.1:{port}", f"{code}"]
+    args = [_task.ADB, "pair", f"127.0.0.1:{port}", f"{code}"]
     res = await _run(args)
     result = res[1].decode("utf8").lower() if res[1] else ""
     return result.find("success") >= 0
@@ -62,40 +63,40 @@ async def adb_connect_local(nm: NotificationManager = None, port: Optional[int]
     assert nm != None or port != None, "Must provide a port, or a NotificationManager to input a port."
     if not isinstance(port, int):
         port = await input_number_in_notification(nm, "Wireless Debug Port")
-    args = [ADB, "connect", f"127.0.0.1:{port}"]
+    args = [_task.ADB, "connect", f"127.0.0.1:{port}"]
     res = await _run(args)
     result = res[1].decode("utf8").lower() if res[1] else ""
     return result.find("connected") >= 0
 
 async def adb_disconnect_all():
-    args = [ADB, "disconnect"]
+    args = [_task.ADB, "disconnect"]
     await _run(args)
 
 async def adb_shell_exec(*cmds: str):
-    args = [ADB, "shell"]
+    args = [_task.ADB, "shell"]
     args.extend(cmds)
     res = await _run(args)
     return res[1].decode("utf8") if res[1] else ""
 
 async def adb_shell(*cmds: str, stdin = True, stdout = True, stderr = True):
-    args = [ADB, "shell"]
+    args = [_task.ADB, "shell"]
     args.extend(cmds)
     proc = await _shell(args, stdin=stdin, stdout=stdout, stderr=stderr)
     return proc
 
 async def adb_start_wireless_adb(port = 5555, reconnect = True):
-    args = [ADB, "tcpip", str(port)]
+    args = [_task.ADB, "tcpip", str(port)]
     await _run(args)
     if reconnect:
         await adb_disconnect_all()
         await adb_connect_local(port=port)
 
 async def adb_start_wireless_adb_root(port = 5555, reconnect = True):
-    args = [SUDO, "setprop", "service.adb.tcp.port", str(port)]
+    args = [_task.SUDO, "setprop", "service.adb.tcp.port", str(port)]
     await _run(args)
-    args = [SUDO, AD_STOP, "adbd"]
+    args = [_task.SUDO, AD_STOP, "adbd"]
     await _run(args)
-    args = [SUDO, AD_START, "adbd"]
+    args = [_task.SUDO, AD_START, "adbd"]
     await _run(args)
     await asyncio.sleep(0.5)
     if reconnect:
@@ -103,7 +104,7 @@ async def adb_start_wireless_adb_root(port = 5555, reconnect = True):
         await adb_connect_local(port=port)
 
 async def adb_is_connect():
-    args = [ADB, "shell", "echo", "ok"]
+    args = [_task.ADB, "shell", "echo", "ok"]
     res = await _run(args)
     result = res[1].decode("utf8").strip() if res[1] else ""
     return result == "ok"
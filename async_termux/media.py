@@ -1,21 +1,21 @@
 from ._task import _run
-from ._task import TERMUX_MEDIA_PLAYER
+from . import _task
 from typing import Optional
 
 async def media_play(file: Optional[str] = None):
-    args = [TERMUX_MEDIA_PLAYER, "play"]
+    args = [_task.TERMUX_MEDIA_PLAYER, "play"]
     if isinstance(file, str):
         args.append(file)
     await _run(args)
 
 async def media_pause():
-    await _run([TERMUX_MEDIA_PLAYER, "pause"])
+    await _run([_task.TERMUX_MEDIA_PLAYER, "pause"])
 
 async def media_stop():
-    await _run([TERMUX_MEDIA_PLAYER, "stop"])
+    await _run([_task.TERMUX_MEDIA_PLAYER, "stop"])
 
 async def media_info():
-    res = await _run([TERMUX_MEDIA_PLAYER, "info"])
+    res = await _run([_task.TERMUX_MEDIA_PLAYER, "info"])
     result = res[1].decode("utf8").rstrip("\r\n") if res[1] else ""
     info = {}
     for line in result.splitlines():
@@ -1,11 +1,12 @@
-from typing import Optional, MutableSet, Callable, Coroutine
+from typing import Optional, Dict, Callable, Coroutine, Final
+from operator import attrgetter
 from ._task import _run, _create_bg_task
-from ._task import TMPDIR, TERMUX_NOTIFICATION_REMOVE, TERMUX_NOTIFICATION, CURL
-import atexit
+from ._task import TMPDIR
+from . import _task
 import asyncio
 import os
-import shlex
-import uuid
+import socket
+import struct
 ActionCallback = Callable[[], Coroutine]
 
 ACTION_CLICK = "click"
@@ -19,7 +20,55 @@ ACTION_MEDIA_NEXT = "media_next"
 ACTION_MEDIA_PREVIOUS = "media_previous"
 async def NO_OP(): pass
 
+_HTTP_OK_RESP: Final[bytes] = b"HTTP/1.1 200 OK\r\n\r\nok"
+
+# (attribute, flag, kind) of plain termux-notification options
+_NOTIF_FIELDS = (
+    ("title", "--title", "value"),
+    ("group", "--group", "value"),
+    ("priority", "--priority", "value"),
+    ("n_type", "--type", "value"),
+    ("alert_once", "--alert-once", "bool"),
+    ("ongoing", "--ongoing", "bool"),
+    ("sound", "--sound", "bool"),
+    ("image_path", "--image-path", "value"),
+    ("icon", "--icon", "value"),
+    ("vibrate", "--vibrate", "value"),
+)
+# (callback attribute, flag, action) for n_type == "media"
+_NOTIF_MEDIA_ACTIONS = (
+    ("action_media_play", "--media-play", ACTION_MEDIA_PLAY),
+    ("action_media_pause", "--media-pause", ACTION_MEDIA_PAUSE),
+    ("action_media_next", "--media-next", ACTION_MEDIA_NEXT),
+    ("action_media_previous", "--media-previous", ACTION_MEDIA_PREVIOUS),
+)
+# (text attribute, flag, action flag, action)
+_NOTIF_BUTTONS = (
+    ("button1", "--button1", "--button1-action", ACTION_BUTTON1),
+    ("button2", "--button2", "--button2-action", ACTION_BUTTON2),
+    ("button3", "--button3", "--button3-action", ACTION_BUTTON3),
+)
+
+def _peer_uid(writer: asyncio.StreamWriter) -> Optional[int]:
+    sock = writer.get_extra_info("socket")
+    try:
+        cred = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    except (AttributeError, OSError):
+        return None
+    pid, uid, gid = struct.unpack("3i", cred)
+    return uid
+
 class Notification:
+    __slots__ = (
+        "n_id", "content", "title", "group", "priority", "n_type",
+        "alert_once", "ongoing", "sound", "image_path", "icon", "vibrate",
+        "button1", "button2", "button3",
+        "action_button1", "action_button2", "action_button3",
+        "action_click", "action_delete",
+        "action_media_play", "action_media_pause", "action_media_next", "action_media_previous",
+        "_flag", "_result", "_curl_key", "_curl_cache",
+    )
+
     def __init__(self, n_id:int, content:str, title:str="", *, group:str="", priority:str="", n_type:str="", alert_once:bool=False, ongoing:bool=False, sound:bool=False, image_path:str="", icon:str="", vibrate:str=""):
         """Notification item.
         - n_id: notification id (will overwrite any previous notification with the same id)
@@ -61,6 +110,8 @@ class Notification:
         self.action_media_previous: ActionCallback = NO_OP
         self._flag = asyncio.Event()
         self._result: Optional[str] = None
+        self._curl_key = None
+        self._curl_cache: Dict[str, str] = {}
     
     def set_click_action(self, action_callback: ActionCallback):
         self.action_click = action_callback
@@ -77,8 +128,8 @@ class Notification:
     def set_media_next_action(self, action_callback: ActionCallback):
         self.action_media_next = action_callback
     
-    def set_media_next_action(self, action_callback: ActionCallback):
-        self.action_media_next = action_callback
+    def set_media_previous_action(self, action_callback: ActionCallback):
+        self.action_media_previous = action_callback
     
     def set_button1(self, button_text: str, action_callback: ActionCallback = NO_OP):
         if not button_text:
@@ -101,6 +152,18 @@ class Notification:
         self.button3 = button_text
         self.action_button3 = action_callback
     
+    def _curl_for(self, action: str, nm: "NotificationManager") -> str:
+        """ curl command string of 'action', cached until n_id or the manager changes """
+        key = (self.n_id, nm.socketpath)
+        if self._curl_key != key:
+            self._curl_key = key
+            self._curl_cache = {}
+        cmd = self._curl_cache.get(action)
+        if cmd is None:
+            cmd = nm._curl_cmd(f"{self.n_id}:{action}")
+            self._curl_cache[action] = cmd
+        return cmd
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Notification):
             return self.n_id == other.n_id
@@ -112,18 +175,35 @@ class Notification:
 
 class NotificationManager:
     """Termux Notification API"""
+    _ACTION_ATTR = {
+        ACTION_CLICK: "action_click",
+        ACTION_DELETE: "action_delete",
+        ACTION_MEDIA_PLAY: "action_media_play",
+        ACTION_MEDIA_PAUSE: "action_media_pause",
+        ACTION_MEDIA_NEXT: "action_media_next",
+        ACTION_MEDIA_PREVIOUS: "action_media_previous",
+        ACTION_BUTTON1: "action_button1",
+        ACTION_BUTTON2: "action_button2",
+        ACTION_BUTTON3: "action_button3",
+    }
+    _ACTION_GETTER = {k: attrgetter(v) for k, v in _ACTION_ATTR.items()}
+    _FINAL_ACTIONS = frozenset((ACTION_CLICK, ACTION_DELETE))
+
     def __init__(self, init_nid = 0):
         """__init__"""
-        self.socketpath = os.path.abspath(os.path.join(TMPDIR, "termux-notification-callback-"+str(uuid.uuid4())+".sock"))
+        import atexit
+        import uuid
+        # abstract namespace socket (leading NUL), never touches the filesystem
+        self.socketpath = f"\0termux-notification-callback-{uuid.uuid4()}"
         self.server: Optional[asyncio.Server] = None
-        self.notification_set: MutableSet[Notification] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.notifications: Dict[int, Notification] = {}
         self._nid: int = init_nid
         atexit.register(self._on_exit_task)
     
     async def send_notification(self, notification_item: Notification):
         """ Send notify """
-        self.notification_set.discard(notification_item)
-        self.notification_set.add(notification_item)
+        self.notifications[notification_item.n_id] = notification_item
         cmd = self._notification_cmd(notification_item)
         await _run(cmd)
     
@@ -134,45 +214,48 @@ class NotificationManager:
         return notification_item._result
     
     async def remove_notification(self, notification_item: Notification):
-        self.notification_set.discard(notification_item)
-        await _run([TERMUX_NOTIFICATION_REMOVE, str(notification_item.n_id)])
+        self.notifications.pop(notification_item.n_id, None)
+        await _run([_task.TERMUX_NOTIFICATION_REMOVE, str(notification_item.n_id)])
 
     async def remove_all_notifications(self):
-        await asyncio.gather(*[_run([TERMUX_NOTIFICATION_REMOVE, str(n.n_id)]) for n in self.notification_set])
+        # termux-notification-remove takes exactly one id, run them in parallel
+        await asyncio.gather(*[_run([_task.TERMUX_NOTIFICATION_REMOVE, str(nid)]) for nid in self.notifications])
 
     async def start_callback_server(self):
-        self.server = await asyncio.start_unix_server(self._callback_server, self.socketpath, start_serving=False)
+        self._loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_unix_server(self._callback_server, self.socketpath, start_serving=False, limit=4096, backlog=16)
         await self.server.start_serving()
 
     async def _callback_server(self, reader, writer):
-        method, http_path, http_version = (await reader.readline()).decode("utf8").split(" ")
-        # ignore header
-        n_id, n_act = http_path.split(":")
+        # abstract sockets have no file permissions, only accept our own uid
+        if _peer_uid(writer) != os.getuid():
+            writer.close()
+            return
+        line = await reader.readline()
+        # ignore header, up to the empty line or EOF
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""): break
+        _, http_path, _ = line.split(b" ", 2)
+        n_id, n_act = http_path.split(b":", 1)
         n_id = int(n_id[1:])
+        n_act = n_act.decode("ascii")
         # print(n_id, n_act)
-        writer.write("HTTP/1.1 200 OK\r\n\r\nok".encode("utf8"))
+        writer.write(_HTTP_OK_RESP)
         await writer.drain()
         writer.close()
         await self._on_action_callback(n_id, n_act)
     
     async def _on_action_callback(self, nid, action):
-        for n in self.notification_set:
-            if n.n_id == nid:
-                break
-        else: return # not found, do nothing
-        if action == ACTION_CLICK and n.action_click: _create_bg_task(n.action_click())
-        elif action == ACTION_DELETE and n.action_delete: _create_bg_task(n.action_delete())
-        elif action == ACTION_MEDIA_PLAY and n.action_media_play: _create_bg_task(n.action_media_play())
-        elif action == ACTION_MEDIA_PAUSE and n.action_media_pause: _create_bg_task(n.action_media_pause())
-        elif action == ACTION_MEDIA_NEXT and n.action_media_next: _create_bg_task(n.action_media_next())
-        elif action == ACTION_MEDIA_PREVIOUS and n.action_media_previous: _create_bg_task(n.action_media_previous())
-        elif action == ACTION_BUTTON1 and n.action_button1: _create_bg_task(n.action_button1())
-        elif action == ACTION_BUTTON2 and n.action_button2: _create_bg_task(n.action_button2())
-        elif action == ACTION_BUTTON3 and n.action_button3: _create_bg_task(n.action_button3())
+        n = self.notifications.get(nid)
+        if n is None: return # not found, do nothing
+        getter = self._ACTION_GETTER.get(action)
+        cb = getter(n) if getter else None
+        if cb: _create_bg_task(cb(), self._loop)
         n._result = action
         n._flag.set()
-        if action in [ACTION_CLICK, ACTION_DELETE]:
-            self.notification_set.discard(n)
+        if action in self._FINAL_ACTIONS:
+            self.notifications.pop(nid, None)
     
     def is_serving(self):
         return self.server.is_serving() if self.server else False
@@ -185,40 +268,26 @@ class NotificationManager:
         return self._nid
 
     def _curl_cmd(self, action_id):
-        return shlex.join([CURL, "-GET", "--unix-socket", self.socketpath, f"http://localhost/{action_id}"])
+        import shlex
+        return shlex.join([_task.CURL, "-GET", "--abstract-unix-socket", self.socketpath[1:], f"http://localhost/{action_id}"])
 
     def _notification_cmd(self, n: Notification):
-        args = [TERMUX_NOTIFICATION]
-        args.extend(["--id", str(n.n_id)])
-        args.extend(["--content", n.content])
-        if n.title: args.extend(["--title", n.title])
-        if n.group: args.extend(["--group", n.group])
-        if n.priority: args.extend(["--priority", n.priority])
-        if n.n_type: args.extend(["--type", n.n_type])
-        if n.alert_once: args.append("--alert-once")
-        if n.ongoing: args.append("--ongoing")
-        if n.sound: args.append("--sound")
-        if n.image_path: args.extend(["--image-path", n.image_path])
-        if n.icon: args.extend(["--icon", n.icon])
-        if n.vibrate: args.extend(["--vibrate", n.vibrate])
-        if n.action_click or not n.ongoing: args.extend(["--action", self._curl_cmd(f"{n.n_id}:{ACTION_CLICK}")])
-        if n.action_delete or not n.ongoing: args.extend(["--on-delete", self._curl_cmd(f"{n.n_id}:{ACTION_DELETE}")])
+        args = [_task.TERMUX_NOTIFICATION, "--id", str(n.n_id), "--content", n.content]
+        for attr, flag, kind in _NOTIF_FIELDS:
+            v = getattr(n, attr)
+            if not v: continue
+            if kind == "bool": args.append(flag)
+            else: args += (flag, v)
+        if n.action_click or not n.ongoing: args += ("--action", n._curl_for(ACTION_CLICK, self))
+        if n.action_delete or not n.ongoing: args += ("--on-delete", n._curl_for(ACTION_DELETE, self))
         if n.n_type == "media":
-            if n.action_media_play: args.extend(["--media-play", self._curl_cmd(f"{n.n_id}:{ACTION_MEDIA_PLAY}")])
-            if n.action_media_pause: args.extend(["--media-pause", self._curl_cmd(f"{n.n_id}:{ACTION_MEDIA_PAUSE}")])
-            if n.action_media_next: args.extend(["--media-next", self._curl_cmd(f"{n.n_id}:{ACTION_MEDIA_NEXT}")])
-            if n.action_media_previous: args.extend(["--media-previous", self._curl_cmd(f"{n.n_id}:{ACTION_MEDIA_PREVIOUS}")])
-        if n.button1:
-            args.extend(["--button1", n.button1])
-            args.extend(["--button1-action", self._curl_cmd(f"{n.n_id}:{ACTION_BUTTON1}")])
-        if n.button2:
-            args.extend(["--button2", n.button2])
-            args.extend(["--button2-action", self._curl_cmd(f"{n.n_id}:{ACTION_BUTTON2}")])
-        if n.button3:
-            args.extend(["--button3", n.button3])
-            args.extend(["--button3-action", self._curl_cmd(f"{n.n_id}:{ACTION_BUTTON3}")])
-        if n.title: args.extend(["--title", n.title])
-        return shlex.join(args)
+            for attr, flag, action in _NOTIF_MEDIA_ACTIONS:
+                if getattr(n, attr): args += (flag, n._curl_for(action, self))
+        for attr, flag, action_flag, action in _NOTIF_BUTTONS:
+            text = getattr(n, attr)
+            if not text: continue
+            args += (flag, text, action_flag, n._curl_for(action, self))
+        return args
     
     def _on_exit_task(self):
         # print("cleaning all notifications...")
@@ -226,7 +295,12 @@ class NotificationManager:
             if self.is_serving():
                 self.stop_callback_server()
         except: pass
-        asyncio.run(self.remove_all_notifications())
+        if self.notifications and _task.TERMUX_NOTIFICATION_REMOVE:
+            # interpreter is exiting, no event loop needed, start all then wait
+            import subprocess
+            procs = [subprocess.Popen([_task.TERMUX_NOTIFICATION_REMOVE, str(nid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) for nid in self.notifications]
+            for proc in procs:
+                proc.wait()
     
     async def __aenter__(self):
         await self.start_callback_server()
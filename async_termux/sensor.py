@@ -1,15 +1,14 @@
 from ._task import _run
-from ._task import TERMUX_SENSOR
+from . import _task
 from typing import Optional
 import asyncio
-import shlex
 import json
 
 BRACE_OPEN = b"{"[0]
 BRACE_CLOSE = b"}"[0]
 
 async def sensor_list():
-    res = await _run([TERMUX_SENSOR, "-l"])
+    res = await _run([_task.TERMUX_SENSOR, "-l"])
     result = res[1].decode("utf8") if res[1] else "{}"
     return json.loads(result).get("sensors", [])
 
@@ -20,13 +19,14 @@ class Sensor:
         self.proc: Optional[asyncio.subprocess.Process] = None
     
     async def read_once(self):
-        args = [TERMUX_SENSOR, "-s", ",".join(self.sensors), "-d", str(self.delay), "-n", "1"]
+        args = [_task.TERMUX_SENSOR, "-s", ",".join(self.sensors), "-d", str(self.delay), "-n", "1"]
         res = await _run(args)
         result = res[1].decode("utf8").rstrip("\r\n") if res[1] else "{}"
         return json.loads(result)
     
     async def __aenter__(self):
-        args = [TERMUX_SENSOR, "-s", ",".join(self.sensors), "-d", str(self.delay)]
+        args = [_task.TERMUX_SENSOR, "-s", ",".join(self.sensors), "-d", str(self.delay)]
+        import shlex
         cmd = shlex.join(args)
         self.proc = await asyncio.create_subprocess_shell(
             cmd,
@@ -41,7 +41,7 @@ class Sensor:
             self.proc.stdin.write_eof()
             await self.proc.stdin.drain()
             self.proc.kill()
-            args = [TERMUX_SENSOR, "-c"]
+            args = [_task.TERMUX_SENSOR, "-c"]
             await _run(args)
             await self.proc.wait()
             self.proc.stdin.close()